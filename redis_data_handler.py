@@ -1,7 +1,19 @@
 import json
+import orjson
 import pandas as pd
 import redis
-from datetime import datetime
+import redis.asyncio
+from redis.utils import HIREDIS_AVAILABLE
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+import threading
+import warnings
+import weakref
 import pytz
 import logging
 
@@ -9,6 +21,228 @@ logging.basicConfig(level=logging.INFO)
 # Configure logger
 logger = logging.getLogger(__name__)
 
+if not HIREDIS_AVAILABLE:
+    logger.info("hiredis is not installed, Redis responses will be parsed in pure Python. "
+                "Install it with 'pip install \"redis[hiredis]\"' for faster parsing.")
+
+# Timezone used for the handler's date, built once rather than per handler instance
+EST = pytz.timezone('US/Eastern')
+
+# Maximum number of connections in each shared connection pool, and seconds a caller waits
+# for a free connection once the pool is exhausted before redis.ConnectionError is raised
+MAX_CONNECTIONS = 50
+POOL_TIMEOUT = 20
+
+# Connection pools shared by all handlers in the process, keyed by connection details
+_CONNECTION_POOLS = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+# redis.asyncio connections only work on the event loop that created them, so async pools are
+# shared per running loop and dropped together with it
+_ASYNC_CONNECTION_POOLS = weakref.WeakKeyDictionary()
+
+# Maximum number of queued DataFrame rows before a pipeline is flushed
+PIPELINE_BATCH_SIZE = 1000
+
+# Number of DataFrame rows encoded per batch, and threads encoding batches for large DataFrames
+ENCODE_BATCH_SIZE = 500
+ENCODE_WORKERS = 2
+# Number of batches encoded ahead of the pipeline, bounding how much of a large DataFrame is held encoded
+ENCODE_LOOKAHEAD = 2
+
+# Number of keys requested per SCAN call and queried per stats pipeline
+SCAN_COUNT = 1000
+
+# orjson options: allow non-string dict keys (as json.dumps does) and encode numpy values natively
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Suffix of the key holding the column names of a DataFrame list published with compact=True
+SCHEMA_SUFFIX = ':__schema__'
+
+# Hash field holding the column order of DataFrames stored by publish_dataframe_columnar
+COLUMNS_FIELD = '__columns__'
+
+# Redis commands returning the number of items held by each collection type
+COUNT_COMMANDS = {
+    'list': 'llen',
+    'set': 'scard',
+    'zset': 'zcard',
+    'hash': 'hlen',
+}
+
+
+def _json_default(obj):
+    """
+    Fallback JSON encoder for values produced by DataFrame rows that orjson
+    does not handle natively (missing values, pandas timestamps and timedeltas, decimals
+    and numpy scalars). Values other than timestamps are encoded as DataFrame.to_json() does.
+    """
+    if pd.api.types.is_scalar(obj) and pd.isna(obj):
+        # pd.NaT, pd.NA and other missing scalars
+        return None
+    if isinstance(obj, (datetime, pd.Timestamp)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        # Whole milliseconds, like DataFrame.to_json()
+        return pd.Timedelta(obj) // pd.Timedelta(1, unit='ms')
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _encode_rows(cols, rows):
+    """
+    Encode a batch of DataFrame row tuples as JSON objects keyed by column name.
+    """
+    return [orjson.dumps(dict(zip(cols, values)), default=_json_default, option=ORJSON_OPTIONS) for values in rows]
+
+def _encode_row_values(rows):
+    """
+    Encode a batch of DataFrame row tuples as JSON arrays of values, without column names.
+    """
+    return [orjson.dumps(values, default=_json_default, option=ORJSON_OPTIONS) for values in rows]
+
+def _row_batches(new_rows, compact):
+    """
+    Split DataFrame rows into batches of row tuples and pick the matching batch encoder.
+
+    Returns:
+    - tuple: The batch encoder function and an iterator over lists of row tuples.
+    """
+    if compact:
+        encode_batch = _encode_row_values
+    else:
+        encode_batch = partial(_encode_rows, new_rows.columns.tolist())
+    # Iterate plain tuples rather than building a Series per row with iterrows()
+    rows = new_rows.itertuples(index=False, name=None)
+    return encode_batch, iter(lambda: list(islice(rows, ENCODE_BATCH_SIZE)), [])
+
+def _schema_key(key):
+    """
+    Get the key holding the column schema of the compact DataFrame list stored under key.
+    """
+    if isinstance(key, bytes):
+        return key + SCHEMA_SUFFIX.encode('utf-8')
+    return key + SCHEMA_SUFFIX
+
+def _encode_schema(cols):
+    """
+    Encode the column schema of a compact DataFrame list.
+
+    Returns:
+    - tuple: The JSON-encoded schema and the column names decoded back from it, so that cached
+      and stored schemas compare equal.
+    """
+    schema = orjson.dumps(cols, option=ORJSON_OPTIONS)
+    return schema, orjson.loads(schema)
+
+def _schema_needs_write(key, cols, key_exists, stored_schema):
+    """
+    Check a compact DataFrame list's stored schema against its columns.
+
+    Returns:
+    - bool: True if the schema must be (re)written, i.e. it is missing or the list does not exist yet.
+
+    Raises:
+    - ValueError: If the list exists and its stored schema has different columns.
+    """
+    if stored_schema is not None and key_exists:
+        stored_cols = orjson.loads(stored_schema)
+        if stored_cols != cols:
+            raise ValueError(f"Columns {cols} do not match the schema already stored for '{key}': {stored_cols}")
+        return False
+    return True
+
+def _encode_ahead(executor, encode_batch, batches):
+    """
+    Encode batches on an executor, keeping at most ENCODE_LOOKAHEAD batches in flight ahead
+    of the consumer, and yield the encoded batches in order.
+    """
+    pending = deque()
+    for batch in batches:
+        pending.append(executor.submit(encode_batch, batch))
+        if len(pending) > ENCODE_LOOKAHEAD:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def _require_pyarrow():
+    """
+    Import the optional pyarrow dependency on first use, so that it is only loaded by the
+    Arrow DataFrame methods.
+
+    Returns:
+    - module: The pyarrow module, with pyarrow.ipc loaded.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Arrow DataFrame storage. Install it with 'pip install pyarrow'.") from e
+    return pa
+
+def _parse_timestamps(values):
+    """
+    Convert a column of timestamps read back from Redis to datetimes.
+
+    ISO 8601 strings written with isoformat() take pandas' ISO 8601 fast path. Values with mixed
+    UTC offsets (e.g. tz-aware timestamps spanning a DST change) are normalised to UTC, and epoch
+    milliseconds written by DataFrame.to_json() in earlier versions are also accepted.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values, unit='ms')
+
+    try:
+        with warnings.catch_warnings():
+            # pandas 2 warns (rather than raising like pandas 3) when offsets are mixed
+            warnings.simplefilter('ignore', FutureWarning)
+            parsed = pd.to_datetime(values, format='ISO8601')
+    except ValueError:
+        parsed = None
+    if parsed is not None and not pd.api.types.is_object_dtype(parsed):
+        return parsed
+
+    numeric = pd.to_numeric(values, errors='coerce')
+    is_epoch = numeric.notna()
+    if is_epoch.any():
+        # A list holding both epoch rows from earlier versions and ISO 8601 rows
+        epochs = pd.to_datetime(numeric[is_epoch], unit='ms', utc=True)
+        isos = pd.to_datetime(values[~is_epoch], format='ISO8601', utc=True)
+        return pd.concat([epochs, isos]).reindex(values.index)
+
+    # Mixed UTC offsets: pandas 3 raises and pandas 2 returns an object column
+    return pd.to_datetime(values, format='ISO8601', utc=True)
+
+def _get_connection_pool(host, port, db, password):
+    """
+    Get the process-wide connection pool for the given connection details, creating it on first use.
+    """
+    pool_key = (host, port, db, password)
+    with _CONNECTION_POOLS_LOCK:
+        pool = _CONNECTION_POOLS.get(pool_key)
+        if pool is None:
+            # Block until a connection is released instead of failing as soon as the cap is reached
+            pool = redis.BlockingConnectionPool(host=host, port=port, db=db, password=password or None,
+                                                max_connections=MAX_CONNECTIONS, timeout=POOL_TIMEOUT)
+            _CONNECTION_POOLS[pool_key] = pool
+        return pool
+
+def _get_async_connection_pool(host, port, db, password):
+    """
+    Get the redis.asyncio connection pool for the given connection details on the running
+    event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    pool_key = (host, port, db, password)
+    with _CONNECTION_POOLS_LOCK:
+        pools = _ASYNC_CONNECTION_POOLS.setdefault(loop, {})
+        pool = pools.get(pool_key)
+        if pool is None:
+            pool = redis.asyncio.BlockingConnectionPool(host=host, port=port, db=db, password=password or None,
+                                                        max_connections=MAX_CONNECTIONS, timeout=POOL_TIMEOUT)
+            pools[pool_key] = pool
+        return pool
+
 class RedisDataHandler:
     """
     The RedisDataHandler class manages interactions with a Redis database, including storing,
@@ -23,19 +257,32 @@ class RedisDataHandler:
     - Manage Redis keys, including deleting keys and getting statistics.
     """
     
-    def __init__(self, host='localhost', port=6379, db=0, password=None):
+    def __init__(self, host='localhost', port=6379, db=0, password=None, connection_pool=None,
+                 async_connection_pool=None):
         """
         Initialize the RedisDataHandler with the specified Redis connection details.
+
+        Handlers created with the same connection details share one connection pool per process,
+        unless a connection_pool is given explicitly (host, port, db and password are then ignored).
+        publish_dataframe_async likewise shares one redis.asyncio pool per event loop, unless an
+        async_connection_pool is given; it is required when connection_pool is given.
         """
-        if password:
-            self.r = redis.Redis(host=host, port=port, db=db, password=password)
+        if connection_pool is None:
+            self._connection_details = (host, port, db, password)
+            connection_pool = _get_connection_pool(host, port, db, password)
         else:
-            self.r = redis.Redis(host=host, port=port, db=db)
-        self.est = pytz.timezone('US/Eastern')
+            self._connection_details = None
+        self.r = redis.Redis(connection_pool=connection_pool)
+        self._async_connection_pool = async_connection_pool
+        # Column schemas of compact DataFrame lists, keyed by Redis key
+        self._schemas = {}
+        # Cleared on the first MEMORY USAGE failure (Redis < 4.0 or a disabled command)
+        self.memory_usage_supported = True
+        self.est = EST
         self.today = datetime.now(self.est).strftime("%Y%m%d")
-        logger.debug(f"Connected to Redis at {host}:{port}, db: {db}")
+        logger.debug("Connected to Redis at %s:%s, db: %s", host, port, db)
 
-    def publish_dataframe(self, df, key, last_published_index, publish=True):
+    def publish_dataframe(self, df, key, last_published_index, publish=True, compact=False):
         """
         Publish new rows from a DataFrame to Redis. Optionally publish via Redis pub/sub.
 
@@ -44,16 +291,159 @@ class RedisDataHandler:
         - key: The Redis key where the DataFrame rows will be stored.
         - last_published_index: The index of the last published row.
         - publish: If True, also publish to Redis pub/sub. Default is True.
+        - compact: If True, store and publish each row as a JSON array of values, with the column
+                   names stored once under key + ':__schema__'. Default is False (JSON objects).
+                   The schema is cached by the handler, so a compact key must have a single writer:
+                   a schema replaced by another writer is not detected.
         """
+        n = len(df)
+        # Nothing new to publish, skip all Redis work (common when polling every tick)
+        if last_published_index >= n - 1:
+            return n - 1
         new_rows = df.iloc[last_published_index + 1:]
-        for _, row in new_rows.iterrows():
-            row_json = row.to_json()
-            self.r.rpush(key, row_json)
-            logger.debug(f"Stored new row for {key} in Redis: {row_json}")
+        if compact:
+            schema = self._ensure_schema(key, new_rows.columns.tolist())
+        encode_batch, batches = _row_batches(new_rows, compact)
+        # Queue all commands in a single non-transactional pipeline to avoid a round-trip per row
+        pipe = self.r.pipeline(transaction=False)
+        if compact:
+            # Restore the schema if it disappeared (e.g. FLUSHDB or expiry) since it was cached
+            pipe.set(_schema_key(key), schema, nx=True)
+        if len(new_rows) <= ENCODE_BATCH_SIZE:
+            for _ in self._queue_rows(pipe, key, map(encode_batch, batches), publish):
+                pipe.execute()
+        else:
+            # Encode upcoming batches in worker threads while earlier ones are sent over the network
+            with ThreadPoolExecutor(max_workers=ENCODE_WORKERS) as executor:
+                for _ in self._queue_rows(pipe, key, _encode_ahead(executor, encode_batch, batches), publish):
+                    pipe.execute()
+        pipe.execute()
+        return n - 1
+
+    async def publish_dataframe_async(self, df, key, last_published_index, publish=True, compact=False):
+        """
+        Asynchronous version of publish_dataframe using redis.asyncio, so that several DataFrames
+        can be published concurrently on one event loop (e.g. with asyncio.gather).
+
+        Parameters:
+        - df: The DataFrame to publish.
+        - key: The Redis key where the DataFrame rows will be stored.
+        - last_published_index: The index of the last published row.
+        - publish: If True, also publish to Redis pub/sub. Default is True.
+        - compact: If True, store and publish each row as a JSON array of values, as in
+                   publish_dataframe (including its single-writer requirement). Default is False.
+        """
+        n = len(df)
+        # Nothing new to publish, skip all Redis work (common when polling every tick)
+        if last_published_index >= n - 1:
+            return n - 1
+        new_rows = df.iloc[last_published_index + 1:]
+        client = self._get_async_client()
+        if compact:
+            schema = await self._ensure_schema_async(client, key, new_rows.columns.tolist())
+        encode_batch, batches = _row_batches(new_rows, compact)
+        async with client.pipeline(transaction=False) as pipe:
+            if compact:
+                # Restore the schema if it disappeared (e.g. FLUSHDB or expiry) since it was cached
+                pipe.set(_schema_key(key), schema, nx=True)
+            for _ in self._queue_rows(pipe, key, map(encode_batch, batches), publish):
+                # Flushing yields to the event loop, letting other publishers encode meanwhile
+                await pipe.execute()
+            await pipe.execute()
+        return n - 1
+
+    def _get_async_client(self):
+        """
+        Get a redis.asyncio client for this handler on the running event loop, using the
+        async_connection_pool if one was given or the shared pool for the handler's connection details.
+        """
+        pool = self._async_connection_pool
+        if pool is None:
+            if self._connection_details is None:
+                raise ValueError("An async_connection_pool is required for async publishing when the handler "
+                                 "is created with a connection_pool.")
+            pool = _get_async_connection_pool(*self._connection_details)
+        return redis.asyncio.Redis(connection_pool=pool)
+
+    def _ensure_schema(self, key, cols):
+        """
+        Make sure the column schema of a compact DataFrame list is stored in Redis and matches cols.
+        The schema is cached per key, so Redis is only queried when the columns change; callers
+        re-set it with NX alongside each publish in case it has since been removed.
+
+        Parameters:
+        - key: The Redis key where the DataFrame rows are stored.
+        - cols: list. The DataFrame column names.
+
+        Returns:
+        - bytes: The JSON-encoded schema.
+        """
+        schema, cols = _encode_schema(cols)
+        if self._schemas.get(key) == cols:
+            return schema
+
+        pipe = self.r.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.get(_schema_key(key))
+        key_exists, stored_schema = pipe.execute()
+        if _schema_needs_write(key, cols, key_exists, stored_schema):
+            self.r.set(_schema_key(key), schema)
+            logger.debug("Stored schema for %s in Redis: %s", key, cols)
+        self._schemas[key] = cols
+        return schema
+
+    async def _ensure_schema_async(self, client, key, cols):
+        """
+        Asynchronous version of _ensure_schema, querying Redis through the given redis.asyncio client.
+
+        Parameters:
+        - client: The redis.asyncio client to query Redis with.
+        - key: The Redis key where the DataFrame rows are stored.
+        - cols: list. The DataFrame column names.
+
+        Returns:
+        - bytes: The JSON-encoded schema.
+        """
+        schema, cols = _encode_schema(cols)
+        if self._schemas.get(key) == cols:
+            return schema
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.get(_schema_key(key))
+            key_exists, stored_schema = await pipe.execute()
+        if _schema_needs_write(key, cols, key_exists, stored_schema):
+            await client.set(_schema_key(key), schema)
+            logger.debug("Stored schema for %s in Redis: %s", key, cols)
+        self._schemas[key] = cols
+        return schema
+
+    def _queue_rows(self, pipe, key, encoded_batches, publish):
+        """
+        Queue encoded DataFrame rows on a pipeline, yielding whenever it has grown large enough
+        that the caller should flush it. Shared by the sync and async publishers, which flush the
+        pipeline with pipe.execute() and await pipe.execute() respectively.
+
+        Parameters:
+        - pipe: The Redis pipeline to queue commands on.
+        - key: The Redis key where the rows will be stored.
+        - encoded_batches: An iterable of lists of JSON-encoded rows.
+        - publish: If True, also publish each row to Redis pub/sub.
+        """
+        queued_rows = 0
+        for batch in encoded_batches:
+            # A single variadic RPUSH appends the whole batch in one command
+            pipe.rpush(key, *batch)
+            logger.debug("Stored %d new rows for %s in Redis", len(batch), key)
             if publish:
-                self.r.publish(key, row_json)
-                logger.debug(f"Published to Redis under key {key}: {row_json}")
-        return len(df) - 1
+                for row_json in batch:
+                    pipe.publish(key, row_json)
+                    logger.debug("Published to Redis under key %s: %s", key, row_json)
+            queued_rows += len(batch)
+            # Flush periodically to bound client-side memory on large DataFrames
+            if queued_rows >= PIPELINE_BATCH_SIZE:
+                yield
+                queued_rows = 0
 
     def publish_to_redis_json(self, data, key, publish=True):
         """
@@ -64,12 +454,16 @@ class RedisDataHandler:
         - key: The Redis key where the data will be stored.
         - publish: If True, also publish to Redis pub/sub. Default is True.
         """
-        json_data = json.dumps(data)
-        self.r.set(key, json_data)
-        logger.debug(f"Stored JSON data in Redis under key {key}: {json_data}")
+        json_data = orjson.dumps(data, default=_json_default, option=ORJSON_OPTIONS)
+        # Send SET and PUBLISH together in a single round-trip
+        pipe = self.r.pipeline(transaction=False)
+        pipe.set(key, json_data)
         if publish:
-            self.r.publish(key, json_data)
-            logger.debug(f"Published to Redis under key {key}: {json_data}")
+            pipe.publish(key, json_data)
+        pipe.execute()
+        logger.debug("Stored JSON data in Redis under key %s: %s", key, json_data)
+        if publish:
+            logger.debug("Published to Redis under key %s: %s", key, json_data)
 
     def publish_to_redis_str(self, data, key, publish=True):
         """
@@ -80,13 +474,64 @@ class RedisDataHandler:
         - key: The Redis key where the string will be stored.
         - publish: If True, also publish to Redis pub/sub. Default is True.
         """
-        self.r.set(key, str(data))
-        logger.debug(f"Stored string data in Redis under key {key}: {data}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Send SET and PUBLISH together in a single round-trip
+        pipe = self.r.pipeline(transaction=False)
+        pipe.set(key, str(data))
+        if publish:
+            pipe.publish(key, str(data))
+        # Read the value back only when it will actually be logged
+        if debug:
+            pipe.get(key)
+        results = pipe.execute()
+        logger.debug("Stored string data in Redis under key %s: %s", key, data)
         if publish:
-            self.r.publish(key, str(data))
-            logger.debug(f"Published to Redis under key {key}: {data}")
-        qb = self.r.get(key)
-        logger.debug(f"redis_client.get({key}) = {qb.decode('utf-8')}")
+            logger.debug("Published to Redis under key %s: %s", key, data)
+        if debug:
+            logger.debug("redis_client.get(%s) = %s", key, results[-1].decode('utf-8'))
+
+    def publish_dataframe_columnar(self, df, key):
+        """
+        Store a whole DataFrame in Redis as a hash with one JSON-encoded list per column,
+        replacing any data previously stored under the key. Hash fields are named after str()
+        of each column, and the original column names are kept in the column order field.
+
+        Parameters:
+        - df: The DataFrame to store.
+        - key: The Redis key where the DataFrame columns will be stored.
+        """
+        columns = [str(col) for col in df.columns]
+        if COLUMNS_FIELD in columns:
+            raise ValueError(f"Column name '{COLUMNS_FIELD}' is reserved for the column order field.")
+        if len(set(columns)) != len(columns):
+            raise ValueError(f"Column names must be unique as strings to be stored as hash fields: {columns}")
+        mapping = {COLUMNS_FIELD: orjson.dumps(df.columns.tolist(), default=_json_default, option=ORJSON_OPTIONS)}
+        for col, values in zip(columns, df.columns):
+            mapping[col] = orjson.dumps(df[values].tolist(), default=_json_default, option=ORJSON_OPTIONS)
+        # Replace the hash atomically so readers never see a mix of old and new columns
+        pipe = self.r.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping=mapping)
+        pipe.execute()
+        logger.debug("Stored %d columns for %s in Redis", len(columns), key)
+
+    def publish_dataframe_arrow(self, df, key):
+        """
+        Store a whole DataFrame in Redis as a single Apache Arrow IPC stream,
+        replacing any data previously stored under the key. Requires pyarrow.
+
+        Parameters:
+        - df: The DataFrame to store.
+        - key: The Redis key where the DataFrame will be stored.
+        """
+        pa = _require_pyarrow()
+        table = pa.Table.from_pandas(df)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        data = sink.getvalue().to_pybytes()
+        self.r.set(key, data)
+        logger.debug("Stored %d rows as Arrow IPC for %s in Redis (%d bytes)", len(df), key, len(data))
 
     def retrieve_dataframe_from_redis(self, key, timestamp_col='timestamp'):
         """
@@ -100,21 +545,33 @@ class RedisDataHandler:
         Returns:
         - DataFrame: A DataFrame created from the Redis list.
         """
-        logger.info(f"Retrieving DataFrame from Redis key: {key} with timestamp column: {timestamp_col}")
+        logger.info("Retrieving DataFrame from Redis key: %s with timestamp column: %s", key, timestamp_col)
         # Get all elements from the Redis list
         data = self.r.lrange(key, 0, -1)
         
-        # Convert the list of JSON strings to a list of dictionaries
-        rows = [json.loads(row.decode('utf-8')) for row in data]
+        # Join the JSON rows into a single array so they are parsed in one call
+        rows = orjson.loads(b'[' + b','.join(data) + b']')
         
-        # Create a DataFrame from the list of dictionaries
-        df = pd.DataFrame(rows)
+        # Create a DataFrame from the list of dictionaries, or of value arrays published with compact=True
+        compact_rows = [isinstance(row, list) for row in rows]
+        if not any(compact_rows):
+            df = pd.DataFrame(rows)
+        else:
+            schema = self.r.get(_schema_key(key))
+            if schema is None:
+                raise ValueError(f"Key '{key}' holds compact rows but its schema key '{key}{SCHEMA_SUFFIX}' is missing.")
+            columns = orjson.loads(schema)
+            if all(compact_rows):
+                df = pd.DataFrame(rows, columns=columns)
+            else:
+                # The list mixes compact rows with rows stored as JSON objects
+                df = pd.DataFrame([dict(zip(columns, row)) if isinstance(row, list) else row for row in rows])
         
         if timestamp_col not in df.columns:
             raise ValueError(f"Column '{timestamp_col}' not found in the data.")
         
         # Convert the specified timestamp column to a datetime object
-        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+        df[timestamp_col] = _parse_timestamps(df[timestamp_col])
         
         # Remove duplicates based on the specified timestamp column and keep the last occurrence
         df = df.drop_duplicates(subset=[timestamp_col], keep='last')
@@ -124,6 +581,49 @@ class RedisDataHandler:
         
         return df
 
+    def retrieve_dataframe_columnar(self, key, timestamp_col='timestamp'):
+        """
+        Retrieve a DataFrame stored as a hash of columns by publish_dataframe_columnar.
+
+        Parameters:
+        - key: The Redis key where the DataFrame columns are stored.
+        - timestamp_col: The column name to be converted to datetime, if present. Default is 'timestamp'.
+
+        Returns:
+        - DataFrame: The DataFrame stored under the key, or None if the key does not exist.
+          Column names come back as stored in JSON (e.g. tuples, but not timestamps, are restored).
+        """
+        fields = self.r.hgetall(key)
+        if not fields:
+            return None
+        columns_json = fields.pop(COLUMNS_FIELD.encode('utf-8'), None)
+        if columns_json is None:
+            raise ValueError(f"Key '{key}' is not a columnar DataFrame: the '{COLUMNS_FIELD}' field is missing.")
+        # JSON turns tuple column names (e.g. from a MultiIndex) into lists, which cannot be column labels
+        columns = [tuple(col) if isinstance(col, list) else col for col in orjson.loads(columns_json)]
+        # Parse each column once instead of one JSON object per row
+        df = pd.DataFrame({col: orjson.loads(fields[str(col).encode('utf-8')]) for col in columns}, columns=columns)
+        if timestamp_col in df.columns:
+            df[timestamp_col] = _parse_timestamps(df[timestamp_col])
+        return df
+
+    def retrieve_dataframe_arrow(self, key):
+        """
+        Retrieve a DataFrame stored as an Apache Arrow IPC stream by publish_dataframe_arrow.
+        Requires pyarrow.
+
+        Parameters:
+        - key: The Redis key where the DataFrame is stored.
+
+        Returns:
+        - DataFrame: The DataFrame stored under the key, or None if the key does not exist.
+        """
+        pa = _require_pyarrow()
+        data = self.r.get(key)
+        if data is None:
+            return None
+        return pa.ipc.open_stream(pa.py_buffer(data)).read_all().to_pandas()
+
     def retrieve_json_from_redis(self, key):
         """
         Retrieve and deserialize JSON data from Redis.
@@ -137,7 +637,11 @@ class RedisDataHandler:
         json_data = self.r.get(key)
         if json_data is None:
             return None
-        return json.loads(json_data.decode('utf-8'))
+        try:
+            return orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            # Values written with json.dumps may contain NaN/Infinity, which orjson rejects
+            return json.loads(json_data)
 
     def retrieve_str_from_redis(self, key):
         """
@@ -159,25 +663,41 @@ class RedisDataHandler:
         Delete a single key or a set of keys from Redis.
 
         Parameters:
-        - keys: str or list of str. A single key or a list of keys to delete.
+        - keys: str or list of str. A single key or a list of keys to delete (bytes keys, as returned
+                by get_all_keys, are accepted too).
 
         Returns:
         - dict: A dictionary containing the number of deleted keys and a list of non-existent keys.
         """
-        if isinstance(keys, str):
+        if isinstance(keys, (str, bytes)):
             keys = [keys]
 
+        # DEL reports whether each key existed, so no separate EXISTS check is needed
+        pipe = self.r.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.delete(key)
+        replies = pipe.execute()
+        key_types, results = replies[::2], replies[1::2]
+
+        # Only lists can be compact DataFrame lists with a schema key to drop alongside them
+        list_keys = [key for key, key_type in zip(keys, key_types) if key_type == b'list']
+        if list_keys:
+            for key in list_keys:
+                pipe.delete(_schema_key(key))
+                self._schemas.pop(key.decode('utf-8') if isinstance(key, bytes) else key, None)
+            pipe.execute()
+
         non_existent_keys = []
         deleted_count = 0
 
-        for key in keys:
-            if self.r.exists(key):
-                self.r.delete(key)
+        for key, deleted in zip(keys, results):
+            if deleted:
                 deleted_count += 1
-                logger.debug(f"Deleted key from Redis: {key}")
+                logger.debug("Deleted key from Redis: %s", key)
             else:
                 non_existent_keys.append(key)
-                logger.debug(f"Key does not exist in Redis: {key}")
+                logger.debug("Key does not exist in Redis: %s", key)
 
         return {
             'Deleted Keys Count': deleted_count,
@@ -188,21 +708,31 @@ class RedisDataHandler:
         """
         Get a list of all keys in the Redis database.
         """
-        return self.r.keys('*')
+        # SCAN walks the keyspace incrementally instead of blocking the server like KEYS *,
+        # but may return a key more than once
+        return list(dict.fromkeys(self.r.scan_iter(match='*', count=SCAN_COUNT)))
 
     def get_keys_dataframe(self):
         """
         Get a DataFrame containing statistics for all keys in the Redis database.
         """
-        all_keys = self.get_all_keys()
-        logger.debug(f"Retrieved all keys from Redis: {all_keys}")
+        all_keys = (key.decode('utf-8') for key in self.r.scan_iter(match='*', count=SCAN_COUNT))
         data = []
-        for key in all_keys:
-            key_str = key.decode('utf-8')
-            stats = self.get_key_stats(key_str)
-            data.append((key_str, stats['Type'], stats['Number of Items'], stats['Size (Bytes)'], stats['Size (MB)']))
+        # Query stats chunk by chunk while scanning, without materializing the full key list
+        while True:
+            keys = list(islice(all_keys, SCAN_COUNT))
+            if not keys:
+                break
+            logger.debug("Retrieved %d keys from Redis", len(keys))
+            for stats in self._get_keys_stats(keys):
+                if stats is None:
+                    # The key expired or was deleted between scanning and querying it
+                    continue
+                data.append((stats['Key'], stats['Type'], stats['Number of Items'], stats['Size (Bytes)'], stats['Size (MB)']))
 
         df = pd.DataFrame(data, columns=['Key', 'Type', 'Number of Items', 'Size (Bytes)', 'Size (MB)'])
+        # SCAN may return the same key more than once
+        df = df.drop_duplicates(subset=['Key'])
         df = df.sort_values(by='Size (MB)', ascending=True)
         return df
 
@@ -217,52 +747,99 @@ class RedisDataHandler:
         - dict: A dictionary containing the type, number of items, size in bytes, and size in megabytes.
         - str: An error message if the key does not exist.
         """
-        if not self.r.exists(key):
+        stats = self._get_keys_stats([key])[0]
+        if stats is None:
             return f"Key '{key}' does not exist in Redis."
 
-        key_type = self.r.type(key).decode('utf-8')
-        stats = {
-            'Key': key,
-            'Type': key_type,
-            'Number of Items': 0,
-            'Size (Bytes)': 0,
-            'Size (MB)': 0.0
-        }
-
-        if key_type == 'string':
-            size_bytes = self.r.strlen(key)
-            stats['Number of Items'] = 1
-            stats['Size (Bytes)'] = size_bytes
-            stats['Size (MB)'] = size_bytes / (1024 * 1024)
-
-        elif key_type == 'list':
-            num_items = self.r.llen(key)
-            size_bytes = sum(len(item) for item in self.r.lrange(key, 0, -1))
-            stats['Number of Items'] = num_items
-            stats['Size (Bytes)'] = size_bytes
-            stats['Size (MB)'] = size_bytes / (1024 * 1024)
-
-        elif key_type == 'set':
-            num_items = self.r.scard(key)
-            size_bytes = sum(len(member) for member in self.r.smembers(key))
-            stats['Number of Items'] = num_items
-            stats['Size (Bytes)'] = size_bytes
-            stats['Size (MB)'] = size_bytes / (1024 * 1024)
-
-        elif key_type == 'zset':
-            num_items = self.r.zcard(key)
-            size_bytes = sum(len(member) for member, _ in self.r.zscan_iter(key))
-            stats['Number of Items'] = num_items
-            stats['Size (Bytes)'] = size_bytes
-            stats['Size (MB)'] = size_bytes / (1024 * 1024)
-
-        elif key_type == 'hash':
-            num_items = self.r.hlen(key)
-            size_bytes = sum(len(field) + len(value) for field, value in self.r.hgetall(key).items())
-            stats['Number of Items'] = num_items
-            stats['Size (Bytes)'] = size_bytes
-            stats['Size (MB)'] = size_bytes / (1024 * 1024)
-
-        logger.debug(f"Key stats for {key}: {stats}")
+        logger.debug("Key stats for %s: %s", key, stats)
         return stats
 
+    def _fetch_sizes(self, pipe, keys, key_types, memory_usage):
+        """
+        Fetch the item counts and sizes for keys of known types in a single pipelined round-trip.
+
+        Parameters:
+        - pipe: The Redis pipeline to queue commands on.
+        - keys: list of str. The Redis keys for which to get sizes.
+        - key_types: list of str. The Redis type of each key.
+        - memory_usage: If True, measure collections with MEMORY USAGE, otherwise fetch their elements.
+
+        Returns:
+        - iterator: The pipeline results, in the order the commands were queued.
+        """
+        for key, key_type in zip(keys, key_types):
+            if key_type == 'string':
+                pipe.strlen(key)
+            elif key_type in COUNT_COMMANDS:
+                getattr(pipe, COUNT_COMMANDS[key_type])(key)
+                if memory_usage:
+                    # Let the server report the size instead of transferring every element to measure it
+                    pipe.memory_usage(key)
+                elif key_type == 'list':
+                    pipe.lrange(key, 0, -1)
+                elif key_type == 'set':
+                    pipe.smembers(key)
+                elif key_type == 'zset':
+                    pipe.zrange(key, 0, -1)
+                elif key_type == 'hash':
+                    pipe.hgetall(key)
+        return iter(pipe.execute())
+
+    def _get_keys_stats(self, keys):
+        """
+        Get statistics for several Redis keys using two pipelined round-trips: one to
+        fetch the key types and one to fetch the item counts and sizes for those types.
+        Collection sizes are the server-side MEMORY USAGE estimate, or the summed length of
+        every element on servers where MEMORY USAGE is unavailable.
+
+        Parameters:
+        - keys: list of str. The Redis keys for which to get stats.
+
+        Returns:
+        - list: A stats dictionary per key, in the same order as keys (None for keys that do not exist).
+        """
+        pipe = self.r.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+        key_types = [key_type.decode('utf-8') for key_type in pipe.execute()]
+
+        # Read the flag once so queueing and decoding agree even if another thread clears it meanwhile
+        memory_usage = self.memory_usage_supported
+        try:
+            results = self._fetch_sizes(pipe, keys, key_types, memory_usage)
+        except redis.ResponseError as e:
+            if not memory_usage or 'unknown command' not in str(e).lower():
+                raise
+            logger.info("MEMORY USAGE is not available on this server, measuring key sizes client-side")
+            self.memory_usage_supported = memory_usage = False
+            results = self._fetch_sizes(pipe, keys, key_types, memory_usage)
+
+        all_stats = []
+        for key, key_type in zip(keys, key_types):
+            if key_type == 'none':
+                all_stats.append(None)
+                continue
+
+            num_items = 0
+            size_bytes = 0
+            if key_type == 'string':
+                num_items = 1
+                size_bytes = next(results)
+            elif key_type in COUNT_COMMANDS:
+                num_items = next(results)
+                if memory_usage:
+                    size_bytes = next(results) or 0
+                elif key_type == 'hash':
+                    fields = next(results)
+                    size_bytes = sum(map(len, fields)) + sum(map(len, fields.values()))
+                else:
+                    size_bytes = sum(map(len, next(results)))
+
+            all_stats.append({
+                'Key': key,
+                'Type': key_type,
+                'Number of Items': num_items,
+                'Size (Bytes)': size_bytes,
+                'Size (MB)': size_bytes / (1024 * 1024)
+            })
+        return all_stats
@@ -0,0 +1,326 @@
+import asyncio
+from decimal import Decimal
+
+import fakeredis
+import orjson
+import pandas as pd
+import pytest
+import redis
+import redis.asyncio
+
+from redis_data_handler import RedisDataHandler
+
+
+@pytest.fixture
+def handler():
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    return RedisDataHandler(connection_pool=client.connection_pool)
+
+
+def test_publish_dataframe_encodes_nat_as_null(handler):
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(['2024-01-01', '2024-01-02']),
+        'expiry': pd.to_datetime(['2024-06-01', None]),
+    })
+    handler.publish_dataframe(df, 'k', -1, publish=False)
+
+    rows = [orjson.loads(row) for row in handler.r.lrange('k', 0, -1)]
+    assert rows[1]['expiry'] is None
+
+
+@pytest.mark.parametrize('values, expected', [
+    (pd.array([1, None], dtype='Int64'), [1, None]),
+    (pd.array(['a', None], dtype='string'), ['a', None]),
+    (pd.to_timedelta(['1s', None]), [1000, None]),
+    ([Decimal('1.5'), None], ['1.5', None]),
+])
+def test_publish_dataframe_encodes_values_like_to_json(handler, values, expected):
+    df = pd.DataFrame({'value': values})
+    handler.publish_dataframe(df, 'k', -1, publish=False)
+
+    assert [orjson.loads(row)['value'] for row in handler.r.lrange('k', 0, -1)] == expected
+
+
+def test_retrieve_json_reads_nan_written_by_json_dumps(handler):
+    handler.r.set('k', '{"a": NaN, "b": Infinity}')
+
+    data = handler.retrieve_json_from_redis('k')
+    assert data['a'] != data['a']
+    assert data['b'] == float('inf')
+
+
+def test_publish_dataframe_keeps_row_order_across_encode_batches(handler):
+    df = pd.DataFrame({'timestamp': pd.date_range('2024-01-01', periods=2500, freq='min'), 'value': range(2500)})
+    assert handler.publish_dataframe(df, 'k', -1, publish=False) == 2499
+
+    values = [orjson.loads(row)['value'] for row in handler.r.lrange('k', 0, -1)]
+    assert values == list(range(2500))
+
+
+def test_dataframe_columnar_round_trip(handler):
+    df = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=3, freq='D'),
+        'price': [1.5, None, 3.0],
+        'symbol': ['a', 'b', 'c'],
+    })
+    handler.publish_dataframe_columnar(df, 'k')
+
+    result = handler.retrieve_dataframe_columnar('k')
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+    assert handler.retrieve_dataframe_columnar('missing') is None
+
+
+@pytest.mark.parametrize('columns', [['__columns__', 'a'], ['a', 'a'], [1, '1']])
+def test_publish_dataframe_columnar_rejects_unstorable_columns(handler, columns):
+    df = pd.DataFrame([[1, 2]], columns=columns)
+    with pytest.raises(ValueError):
+        handler.publish_dataframe_columnar(df, 'k')
+    assert not handler.r.exists('k')
+
+
+def test_dataframe_arrow_round_trip(handler):
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=3, freq='D', tz='US/Eastern'),
+        'price': [1.5, None, 3.0],
+        'symbol': ['a', 'b', 'c'],
+    })
+    handler.publish_dataframe_arrow(df, 'k')
+
+    pd.testing.assert_frame_equal(handler.retrieve_dataframe_arrow('k'), df)
+    assert handler.retrieve_dataframe_arrow('missing') is None
+
+
+def test_retrieve_dataframe_parses_timestamps_across_dst_change(handler):
+    timestamps = pd.date_range('2024-03-09', periods=3, freq='D', tz='US/Eastern')
+    df = pd.DataFrame({'timestamp': timestamps, 'value': [1, 2, 3]})
+    handler.publish_dataframe(df, 'k', -1, publish=False)
+
+    result = handler.retrieve_dataframe_from_redis('k')
+    assert isinstance(result['timestamp'].dtype, pd.DatetimeTZDtype)
+    assert str(result['timestamp'].dt.tz) == 'UTC'
+    assert list(result['timestamp']) == list(timestamps)
+    assert list(result['value']) == [1, 2, 3]
+
+
+def test_retrieve_dataframe_keeps_naive_timestamps_with_nulls_naive(handler):
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(['2024-01-01', '2024-01-02']),
+        'expiry': pd.to_datetime(['2024-06-01', None]),
+        'value': [1, 2],
+    })
+    handler.publish_dataframe(df, 'k', -1, publish=False)
+
+    result = handler.retrieve_dataframe_from_redis('k', timestamp_col='expiry')
+    assert result['expiry'].dt.tz is None
+    assert result['expiry'].isna().sum() == 1
+
+
+def test_retrieve_dataframe_reads_epoch_ms_rows_from_earlier_versions(handler):
+    handler.r.rpush('k', '{"timestamp":1704067200000,"value":1}', '{"timestamp":1704153600000,"value":2}')
+
+    result = handler.retrieve_dataframe_from_redis('k')
+    assert list(result['timestamp']) == list(pd.to_datetime(['2024-01-01', '2024-01-02']))
+
+
+def test_retrieve_dataframe_reads_epoch_ms_rows_mixed_with_iso_rows(handler):
+    handler.r.rpush('k', '{"timestamp":1704067200000,"value":1}')
+    df = pd.DataFrame({'timestamp': pd.to_datetime(['2024-01-02']), 'value': [2]})
+    handler.publish_dataframe(df, 'k', -1, publish=False)
+
+    result = handler.retrieve_dataframe_from_redis('k')
+    assert list(result['timestamp']) == list(pd.to_datetime(['2024-01-01', '2024-01-02'], utc=True))
+    assert list(result['value']) == [1, 2]
+
+
+def test_handlers_share_a_blocking_pool_per_connection_target():
+    first = RedisDataHandler(host='redis.example', port=6380, db=1)
+    second = RedisDataHandler(host='redis.example', port=6380, db=1)
+    other = RedisDataHandler(host='redis.example', port=6380, db=2)
+
+    assert first.r.connection_pool is second.r.connection_pool
+    assert first.r.connection_pool is not other.r.connection_pool
+    assert isinstance(first.r.connection_pool, redis.BlockingConnectionPool)
+
+
+def _compact_df(periods=3, start='2024-01-01'):
+    return pd.DataFrame({'timestamp': pd.date_range(start, periods=periods, freq='D'), 'value': range(periods)})
+
+
+def test_compact_publish_round_trip(handler):
+    df = _compact_df()
+    handler.publish_dataframe(df, 'k', -1, publish=False, compact=True)
+
+    assert orjson.loads(handler.r.lindex('k', 0)) == ['2024-01-01T00:00:00', 0]
+    result = handler.retrieve_dataframe_from_redis('k')
+    assert list(result.columns) == ['timestamp', 'value']
+    assert list(result['value']) == [0, 1, 2]
+
+
+def test_compact_publish_restores_schema_removed_after_caching(handler):
+    handler.publish_dataframe(_compact_df(), 'k', -1, publish=False, compact=True)
+    handler.r.flushdb()
+    handler.publish_dataframe(_compact_df(start='2024-02-01'), 'k', -1, publish=False, compact=True)
+
+    assert list(handler.retrieve_dataframe_from_redis('k')['value']) == [0, 1, 2]
+
+
+def test_compact_publish_rejects_columns_not_matching_stored_schema(handler):
+    handler.publish_dataframe(_compact_df(), 'k', -1, publish=False, compact=True)
+    other = _compact_df().rename(columns={'value': 'price'})
+
+    with pytest.raises(ValueError):
+        handler.publish_dataframe(other, 'k', -1, publish=False, compact=True)
+
+
+def test_compact_rows_mixed_with_object_rows(handler):
+    df = _compact_df()
+    handler.publish_dataframe(df.iloc[:1], 'k', -1, publish=False)
+    handler.publish_dataframe(df, 'k', 0, publish=False, compact=True)
+
+    assert list(handler.retrieve_dataframe_from_redis('k')['value']) == [0, 1, 2]
+
+
+def test_retrieve_dataframe_ignores_schema_key_for_object_rows(handler):
+    handler.publish_dataframe(_compact_df(), 'foo', -1, publish=False)
+    handler.r.set('foo:__schema__', 'not json')
+
+    assert list(handler.retrieve_dataframe_from_redis('foo')['value']) == [0, 1, 2]
+
+
+def test_delete_keys_removes_schema_of_compact_list(handler):
+    handler.publish_dataframe(_compact_df(), 'k', -1, publish=False, compact=True)
+
+    result = handler.delete_keys(['k', 'missing'])
+    assert result == {'Deleted Keys Count': 1, 'Non-existent Keys': ['missing']}
+    assert not handler.r.exists('k:__schema__')
+
+
+def test_publish_dataframe_async_can_run_on_successive_event_loops():
+    server = fakeredis.FakeServer()
+    handler = RedisDataHandler(connection_pool=fakeredis.FakeRedis(server=server).connection_pool,
+                               async_connection_pool=fakeredis.FakeAsyncRedis(server=server).connection_pool)
+    df = _compact_df(periods=1500)
+
+    assert asyncio.run(handler.publish_dataframe_async(df.iloc[:1000], 'k', -1, publish=False)) == 999
+    assert asyncio.run(handler.publish_dataframe_async(df, 'k', 999)) == 1499
+    assert list(handler.retrieve_dataframe_from_redis('k')['value']) == list(range(1500))
+
+
+def test_async_pools_are_shared_per_event_loop():
+    handler = RedisDataHandler(host='redis.example')
+
+    async def pools():
+        return handler._get_async_client().connection_pool, handler._get_async_client().connection_pool
+
+    first, same = asyncio.run(pools())
+    second, _ = asyncio.run(pools())
+    assert first is same
+    assert first is not second
+    assert isinstance(first, redis.asyncio.BlockingConnectionPool)
+    assert first.connection_kwargs['host'] == 'redis.example'
+
+
+def test_publish_dataframe_async_requires_async_pool_with_explicit_pool(handler):
+    with pytest.raises(ValueError):
+        asyncio.run(handler.publish_dataframe_async(_compact_df(), 'k', -1))
+
+
+def _populate_key_types(handler):
+    handler.r.set('string', 'abcd')
+    handler.r.rpush('list', 'a', 'bc')
+    handler.r.sadd('set', 'abc')
+    handler.r.zadd('zset', {'a': 1, 'bcd': 2})
+    handler.r.hset('hash', mapping={'f': 'vv', 'gg': 'w'})
+
+
+def test_get_key_stats_measures_each_type_client_side_without_memory_usage(handler):
+    _populate_key_types(handler)
+    expected = {
+        'string': (1, 4),
+        'list': (2, 3),
+        'set': (1, 3),
+        'zset': (2, 4),
+        'hash': (2, 6),
+    }
+
+    for key, (num_items, size_bytes) in expected.items():
+        stats = handler.get_key_stats(key)
+        assert stats['Type'] == key
+        assert (stats['Number of Items'], stats['Size (Bytes)']) == (num_items, size_bytes)
+        assert stats['Size (MB)'] == size_bytes / (1024 * 1024)
+    assert handler.memory_usage_supported is False
+    assert handler.get_key_stats('missing') == "Key 'missing' does not exist in Redis."
+
+
+def test_get_key_stats_uses_memory_usage_when_available(handler, monkeypatch):
+    handler.r.rpush('list', 'a', 'bc')
+    monkeypatch.setattr(redis.client.Pipeline, 'memory_usage', lambda pipe, key: pipe.strlen('size'), raising=False)
+    handler.r.set('size', 'x' * 72)
+
+    stats = handler.get_key_stats('list')
+    assert (stats['Number of Items'], stats['Size (Bytes)']) == (2, 72)
+    assert handler.memory_usage_supported is True
+
+
+def test_get_keys_dataframe_lists_every_key_sorted_by_size(handler):
+    _populate_key_types(handler)
+
+    df = handler.get_keys_dataframe()
+    assert list(df.columns) == ['Key', 'Type', 'Number of Items', 'Size (Bytes)', 'Size (MB)']
+    assert sorted(df['Key']) == ['hash', 'list', 'set', 'string', 'zset']
+    assert list(df['Size (MB)']) == sorted(df['Size (MB)'])
+    assert df.set_index('Key').loc['hash', 'Size (Bytes)'] == 6
+
+
+def test_get_all_keys_drops_duplicates_returned_by_scan(handler, monkeypatch):
+    handler.r.set('a', 1)
+    handler.r.set('b', 2)
+    monkeypatch.setattr(handler.r, 'scan_iter', lambda **kwargs: iter([b'a', b'b', b'a']))
+
+    assert handler.get_all_keys() == [b'a', b'b']
+
+
+def test_dataframe_columnar_keeps_non_string_column_names(handler):
+    df = pd.DataFrame([[1, 2.5], [3, 4.5]], columns=[0, 1])
+    handler.publish_dataframe_columnar(df, 'k')
+
+    pd.testing.assert_frame_equal(handler.retrieve_dataframe_columnar('k'), df)
+
+
+def test_retrieve_dataframe_columnar_rejects_hash_without_column_order(handler):
+    handler.r.hset('k', mapping={'a': '[1]'})
+
+    with pytest.raises(ValueError):
+        handler.retrieve_dataframe_columnar('k')
+
+
+def test_publish_dataframe_async_compact_uses_only_the_async_pool():
+    async_server = fakeredis.FakeServer()
+    # The sync pool points at a different server, so any sync I/O would miss the data
+    handler = RedisDataHandler(connection_pool=fakeredis.FakeRedis(server=fakeredis.FakeServer()).connection_pool,
+                               async_connection_pool=fakeredis.FakeAsyncRedis(server=async_server).connection_pool)
+    asyncio.run(handler.publish_dataframe_async(_compact_df(), 'k', -1, publish=False, compact=True))
+
+    reader = fakeredis.FakeRedis(server=async_server)
+    assert orjson.loads(reader.get('k:__schema__')) == ['timestamp', 'value']
+    assert reader.llen('k') == 3
+    assert not handler.r.exists('k:__schema__')
+
+
+def test_delete_keys_accepts_get_all_keys_output(handler):
+    handler.publish_dataframe(_compact_df(), 'k', -1, publish=False, compact=True)
+    handler.r.set('plain', 'x')
+    keys = handler.get_all_keys()
+
+    result = handler.delete_keys(keys)
+    assert result['Deleted Keys Count'] + len(result['Non-existent Keys']) == len(keys)
+    assert handler.get_all_keys() == []
+
+
+def test_delete_keys_keeps_schema_suffixed_keys_of_non_lists(handler):
+    handler.r.set('plain', 'x')
+    handler.r.set('plain:__schema__', 'unrelated')
+
+    assert handler.delete_keys('plain') == {'Deleted Keys Count': 1, 'Non-existent Keys': []}
+    assert handler.r.get('plain:__schema__') == b'unrelated'